@@ -1,37 +1,55 @@
 import os
+import sys
 import time
 import hashlib
+import heapq
+import hmac
+import secrets
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from collections import deque
 
-class ProcessState(Enum):
-    NEW = "Nuevo"
-    READY = "Listo"
-    RUNNING = "Ejecutando"
-    WAITING = "Esperando"
-    TERMINATED = "Terminado"
+class ProcessState(IntEnum):
+    NEW = 0
+    READY = 1
+    RUNNING = 2
+    WAITING = 3
+    TERMINATED = 4
+
+STATE_NAMES = ["Nuevo", "Listo", "Ejecutando", "Esperando", "Terminado"]
 
 class Process:
+    __slots__ = ('pid', 'name', 'state', 'priority', 'memory_required', 'created_at_ns', 'cpu_time_used', '_key', '_str_prefix')
+    
     def __init__(self, pid, name, priority=1, memory_required=1024):
         self.pid = pid
         self.name = name
         self.state = ProcessState.NEW
         self.priority = priority
         self.memory_required = memory_required
-        self.created_at = datetime.now()
+        self.created_at_ns = time.monotonic_ns()
         self.cpu_time_used = 0
+        self._key = -priority
+        self._str_prefix = f"PID: {pid}, Nombre: {name}, Estado: "
+        
+    def set_priority(self, priority):
+        self.priority = priority
+        self._key = -priority
         
     def __str__(self):
-        return f"PID: {self.pid}, Nombre: {self.name}, Estado: {self.state.value}"
+        return self._str_prefix + STATE_NAMES[self.state]
 
 class ProcessScheduler:
     def __init__(self):
-        self.ready_queue = deque()
+        self.ready_queue = []
         self.running_process = None
         self.processes = {}
         self.next_pid = 1
         self.quantum = 3
+        self._counter = 0
+        self._entries = {}
+        self.log = deque(maxlen=100000)
+        self.verbose = True
         
     def create_process(self, name, priority=1, memory=1024):
         pid = self.next_pid
@@ -39,21 +57,49 @@ class ProcessScheduler:
         self.processes[pid] = process
         self.next_pid += 1
         process.state = ProcessState.READY
-        self.ready_queue.append(process)
-        print(f"Proceso creado: {process}")
+        self._enqueue(process)
+        self._emit(f"Proceso creado: {process}")
         return pid
     
+    def _emit(self, msg):
+        if self.verbose:
+            print(msg)
+        else:
+            self.log.append(msg)
+    
+    def flush_log(self):
+        if self.log:
+            sys.stdout.write("\n".join(self.log) + "\n")
+            self.log.clear()
+    
+    def _enqueue(self, process):
+        entry = [process._key, self._counter, process]
+        self._entries[process.pid] = entry
+        heapq.heappush(self.ready_queue, entry)
+        self._counter += 1
+    
+    def set_priority(self, pid, priority):
+        process = self.processes[pid]
+        process.set_priority(priority)
+        entry = self._entries.get(process.pid)
+        if entry:
+            entry[-1] = None
+            self._enqueue(process)
+    
     def schedule(self):
         if self.running_process:
             if self.running_process.cpu_time_used < self.quantum:
                 return self.running_process
             self.running_process.state = ProcessState.READY
-            self.ready_queue.append(self.running_process)
+            self._enqueue(self.running_process)
         
-        if self.ready_queue:
-            sorted_queue = sorted(self.ready_queue, key=lambda x: x.priority, reverse=True)
-            self.ready_queue = deque(sorted_queue)
-            next_process = self.ready_queue.popleft()
+        while self.ready_queue:
+            _, _, next_process = heapq.heappop(self.ready_queue)
+            if next_process is None:
+                continue
+            del self._entries[next_process.pid]
+            if next_process.state != ProcessState.READY:
+                continue
             next_process.state = ProcessState.RUNNING
             self.running_process = next_process
             return next_process
@@ -63,11 +109,11 @@ class ProcessScheduler:
         current_process = self.schedule()
         if current_process:
             current_process.cpu_time_used += 1
-            print(f"Ejecutando: {current_process.name} (CPU time: {current_process.cpu_time_used})")
+            self._emit(f"Ejecutando: {current_process.name} (CPU time: {current_process.cpu_time_used})")
             if current_process.cpu_time_used >= 5:
                 self.terminate_process(current_process.pid)
         else:
-            print("No hay procesos en cola")
+            self._emit("No hay procesos en cola")
     
     def terminate_process(self, pid):
         if pid in self.processes:
@@ -75,7 +121,7 @@ class ProcessScheduler:
             process.state = ProcessState.TERMINATED
             if self.running_process and self.running_process.pid == pid:
                 self.running_process = None
-            print(f"Proceso terminado: {process.name}")
+            self._emit(f"Proceso terminado: {process.name}")
 
 class MemoryManager:
     def __init__(self, total_memory=1024 * 1024):
@@ -83,25 +129,27 @@ class MemoryManager:
         self.available_memory = total_memory
         self.memory_map = {}
         self.page_size = 4096
+        self.pages_by_process = {}
+        self._next_page_id = 0
         
     def allocate_memory(self, process, size):
         if size > self.available_memory:
             raise MemoryError("Memoria insuficiente")
         pages_needed = (size + self.page_size - 1) // self.page_size
-        allocated_pages = []
-        for i in range(pages_needed):
-            page_id = len(self.memory_map)
-            self.memory_map[page_id] = {'process': process.pid, 'allocated_at': datetime.now()}
-            allocated_pages.append(page_id)
+        start = self._next_page_id
+        self._next_page_id += pages_needed
+        allocated_pages = list(range(start, start + pages_needed))
+        self.memory_map.update(dict.fromkeys(allocated_pages, process.pid))
+        self.pages_by_process.setdefault(process.pid, []).extend(allocated_pages)
         self.available_memory -= pages_needed * self.page_size
         print(f"Memoria asignada: {pages_needed} paginas para {process.name}")
         return allocated_pages
     
     def free_memory(self, process_pid):
-        pages_to_free = [pid for pid, info in self.memory_map.items() if info['process'] == process_pid]
+        pages_to_free = self.pages_by_process.pop(process_pid, [])
         for page_id in pages_to_free:
             del self.memory_map[page_id]
-            self.available_memory += self.page_size
+        self.available_memory += len(pages_to_free) * self.page_size
         print(f"Memoria liberada: {len(pages_to_free)} paginas del proceso {process_pid}")
 
 class FileSystem:
@@ -109,9 +157,18 @@ class FileSystem:
         self.files = {}
         self.directories = {'/': {'type': 'directory', 'children': {}}}
         self.current_directory = '/'
+        self.dir_index = {'/': []}
         
     def create_file(self, filename, content=""):
-        filepath = os.path.join(self.current_directory, filename).replace('\\', '/')
+        if filename.startswith('/'):
+            filepath = filename
+        elif self.current_directory == '/':
+            filepath = '/' + filename
+        else:
+            filepath = self.current_directory + '/' + filename
+        if filepath not in self.files:
+            directory = os.path.dirname(filepath)
+            self.dir_index.setdefault(directory, []).append(os.path.basename(filepath))
         self.files[filepath] = {
             'content': content,
             'created_at': datetime.now(),
@@ -123,10 +180,7 @@ class FileSystem:
     def list_directory(self, path='.'):
         if path == '.':
             path = self.current_directory
-        contents = []
-        for item_path, info in self.files.items():
-            if os.path.dirname(item_path) == path:
-                contents.append((os.path.basename(item_path), 'file'))
+        contents = [(name, 'file') for name in self.dir_index.get(path, ())]
         print(f"Contenido de {path}:")
         for name, type_ in contents:
             print(f"  {name} ({type_})")
@@ -135,18 +189,25 @@ class SecurityManager:
     def __init__(self):
         self.users = {}
         self.sessions = {}
+        self.hash_iterations = 150000
         
     def create_user(self, username, password):
-        hashed_password = hashlib.sha256(password.encode()).hexdigest()
-        self.users[username] = {'hashed_password': hashed_password, 'created_at': datetime.now()}
+        salt = os.urandom(16)
+        iterations = self.hash_iterations
+        hashed_password = self.hash_password(password, salt, iterations)
+        self.users[username] = {'hashed_password': hashed_password, 'salt': salt, 'iterations': iterations, 'created_at': datetime.now()}
         print(f"Usuario creado: {username}")
     
+    def hash_password(self, password, salt, iterations):
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, iterations)
+    
     def authenticate(self, username, password):
         if username not in self.users:
             return False
-        hashed_input = hashlib.sha256(password.encode()).hexdigest()
-        if self.users[username]['hashed_password'] == hashed_input:
-            session_id = hashlib.md5(f"{username}{datetime.now()}".encode()).hexdigest()
+        user = self.users[username]
+        hashed_input = self.hash_password(password, user['salt'], user['iterations'])
+        if hmac.compare_digest(user['hashed_password'], hashed_input):
+            session_id = secrets.token_hex(16)
             self.sessions[session_id] = {'username': username, 'login_time': datetime.now()}
             print(f"Autenticacion exitosa: {username}")
             return session_id
@@ -157,6 +218,14 @@ class NexusCLI:
         self.os = os_instance
         self.current_user = None
         self.session_id = None
+        self._commands = {
+            'login': self.handle_login,
+            'run': self.handle_run_process,
+            'list': self.handle_list,
+            'create': self.handle_create_file,
+            'meminfo': lambda args: self.show_memory_info(),
+            'help': lambda args: self.show_help()
+        }
         
     def start_cli(self):
         print("NEXUS OS - Interfaz de Comandos")
@@ -178,18 +247,9 @@ class NexusCLI:
                 
                 if cmd == 'exit':
                     break
-                elif cmd == 'login':
-                    self.handle_login(args)
-                elif cmd == 'run':
-                    self.handle_run_process(args)
-                elif cmd == 'list':
-                    self.handle_list(args)
-                elif cmd == 'create':
-                    self.handle_create_file(args)
-                elif cmd == 'meminfo':
-                    self.show_memory_info()
-                elif cmd == 'help':
-                    self.show_help()
+                handler = self._commands.get(cmd)
+                if handler:
+                    handler(args)
                 else:
                     print(f"Comando no reconocido: {cmd}")
                     
@@ -221,9 +281,9 @@ class NexusCLI:
     
     def handle_list(self, args):
         if not args or args[0] == 'processes':
-            print("Procesos en el sistema:")
-            for pid, process in self.os.scheduler.processes.items():
-                print(f"  {process}")
+            lines = ["Procesos en el sistema:"]
+            lines.extend(f"  {process}" for process in self.os.scheduler.processes.values())
+            sys.stdout.write("\n".join(lines) + "\n")
         elif args[0] == 'files':
             self.os.filesystem.list_directory()
     
@@ -245,14 +305,16 @@ class NexusCLI:
         print(f"  Paginas asignadas: {len(memory.memory_map)}")
     
     def show_help(self):
-        print("Comandos disponibles:")
-        print("  login <user> <pass>  - Iniciar sesion")
-        print("  run <name> [pri]     - Ejecutar proceso")
-        print("  list processes       - Listar procesos")
-        print("  list files           - Listar archivos")
-        print("  create <file> [cont] - Crear archivo")
-        print("  meminfo              - Info de memoria")
-        print("  exit                 - Salir del sistema")
+        sys.stdout.write(
+            "Comandos disponibles:\n"
+            "  login <user> <pass>  - Iniciar sesion\n"
+            "  run <name> [pri]     - Ejecutar proceso\n"
+            "  list processes       - Listar procesos\n"
+            "  list files           - Listar archivos\n"
+            "  create <file> [cont] - Crear archivo\n"
+            "  meminfo              - Info de memoria\n"
+            "  exit                 - Salir del sistema\n"
+        )
 
 class NexusOS:
     def __init__(self):
@@ -272,18 +334,24 @@ class NexusOS:
         self.filesystem.create_file("readme.txt", "Bienvenido a NexusOS")
         self.filesystem.create_file("system.log", "Log del sistema")
     
-    def run_simulation(self):
+    def run_simulation(self, cycles=10, tick_delay=0.0):
         print("MODO SIMULACION DEL SISTEMA")
         processes = [("navegador", 2), ("editor", 1), ("calculadora", 1), ("reproductor", 3)]
         for name, priority in processes:
             self.scheduler.create_process(name, priority)
-        for i in range(10):
-            print(f"Ciclo {i+1}")
-            self.scheduler.execute_cycle()
-            time.sleep(1)
+        execute_cycle = self.scheduler.execute_cycle
+        emit = self.scheduler._emit
+        next_tick = time.monotonic()
+        for i in range(cycles):
+            emit(f"Ciclo {i+1}")
+            execute_cycle()
+            if tick_delay:
+                next_tick += tick_delay
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+        self.scheduler.flush_log()
     
     def start_system(self):
-        self.run_simulation()
+        self.run_simulation(tick_delay=1.0)
         self.cli.start_cli()
 
 if __name__ == "__main__":